@@ -1,12 +1,22 @@
 import os
-import time
+import queue
+import signal
 import datetime
 import threading
 import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
+from operator import itemgetter
+from typing import Optional
 
+import numpy as np
+import orjson
 import requests
 import bittensor as bt
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pydantic import TypeAdapter, ValidationError
 from dotenv import load_dotenv
 
 load_dotenv(".env", override=True)
@@ -31,6 +41,74 @@ from .router import start_ping_server
 from ._base import BaseScoringApi
 
 SCORING_API_PORT = int(os.getenv(f"{ENV_PREFIX_SCORING_API}PORT", 8000))
+HTTP_POOL_MAXSIZE = 64
+HTTP_REQUEST_TIMEOUT = 60
+VALIDATOR_FETCH_MAX_WORKERS = 32
+SCORING_CACHE_FETCH_MAX_WORKERS = 16
+STORE_QUEUE_MAXSIZE = 256
+STORE_WORKER_JOIN_TIMEOUT = 30
+SCORING_RESULTS_BATCH_SIZE = 50
+SCORING_RESULTS_BATCH_MAX_BYTES = 2 * 1024 * 1024
+
+_INF = float("inf")
+# Match stdlib json on controller output: NumPy scalars/arrays and non-str dict keys
+_ORJSON_DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+_COMMIT_LIST_ADAPTER = TypeAdapter(list[MinerChallengeCommit])
+_SCORING_LOG_LIST_ADAPTER = TypeAdapter(list[ScoringLog])
+_COMPARISON_LOG_MAP_ADAPTER = TypeAdapter(dict[str, list[ComparisonLog]])
+
+
+def _validate_scoring_result(result: dict) -> dict:
+    """
+    Validate a raw scoring result from centralized storage into the scoring cache format.
+
+    Returns:
+        dict: Scoring logs, comparison logs and scored timestamp
+    """
+    return {
+        "scoring_logs": _SCORING_LOG_LIST_ADAPTER.validate_python(
+            result["scoring_logs"]
+        ),
+        "comparison_logs": _COMPARISON_LOG_MAP_ADAPTER.validate_python(
+            result["comparison_logs"]
+        ),
+        "scored_timestamp": result.get("scored_timestamp"),
+    }
+
+
+def _merge_miner_commit(
+    current: MinerChallengeCommit, candidate: MinerChallengeCommit
+) -> MinerChallengeCommit:
+    """
+    Merge two commits of the same miner and challenge reported by different validators.
+
+    For the same encrypted_commit, the current commit is kept and completed in place
+    with the older commit timestamp and any missing key/commit. For a different
+    encrypted_commit, the newer one by timestamp is kept.
+
+    Returns:
+        MinerChallengeCommit: The commit to keep
+    """
+    if candidate.encrypted_commit == current.encrypted_commit:
+        if (
+            candidate.commit_timestamp
+            and current.commit_timestamp
+            and candidate.commit_timestamp < current.commit_timestamp
+        ):
+            current.commit_timestamp = candidate.commit_timestamp
+        if not current.key:
+            current.key = candidate.key
+        if not current.commit:
+            current.commit = candidate.commit
+        return current
+
+    if (
+        candidate.commit_timestamp
+        and current.commit_timestamp
+        and candidate.commit_timestamp > current.commit_timestamp
+    ):
+        return candidate
+    return current
 
 
 class ScoringApi(BaseScoringApi):
@@ -60,7 +138,8 @@ class ScoringApi(BaseScoringApi):
         State Management:
             - validators_miner_commits: Stores current miner commits from all validators
             - miner_commits: Aggregated miner commits from all validators
-            - miner_commits_cache: Quick lookup cache mapping challenge_name---encrypted_commit to commit
+            - miner_commits_by_challenge: Aggregated miner commits indexed by challenge name
+            - miner_commits_cache: Quick lookup cache mapping (challenge_name, encrypted_commit) to commit
             - scoring_results: Cache for scored docker_hub_ids with their scoring and comparison logs
             - challenge_managers: Per-challenge scoring logic
             - storage_manager: Persistent storage manager
@@ -92,11 +171,46 @@ class ScoringApi(BaseScoringApi):
             validator_request_header_fn=self.validator_request_header_fn,
             sync_on_init=True,
         )
+        # Shared HTTP session so connections to storage are reused across requests
+        self._http = requests.Session()
+        _http_adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_MAXSIZE,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            # Only retry gateway errors, never resend a signed request after a connect/read failure.
+            # Uploads use _upload_http instead, see below.
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                read=0,
+                other=0,
+                backoff_factor=0.25,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=None,
+                raise_on_status=False,
+            ),
+        )
+        self._http.mount("http://", _http_adapter)
+        self._http.mount("https://", _http_adapter)
+        # Uploads are not idempotent and a 504 may follow a completed write, so they are never retried
+        self._upload_http = requests.Session()
+        _upload_http_adapter = HTTPAdapter(max_retries=0)
+        self._upload_http.mount("http://", _upload_http_adapter)
+        self._upload_http.mount("https://", _upload_http_adapter)
+        # Miner commits are stored by a background worker to keep forward() unblocked
+        # None is queued to stop the worker after it has stored everything queued before it
+        self._store_queue: queue.Queue[
+            Optional[dict[str, list[MinerChallengeCommit]]]
+        ] = queue.Queue(maxsize=STORE_QUEUE_MAXSIZE)
+        self._store_thread = threading.Thread(
+            target=self._store_worker, daemon=True, name="store_miner_commits_thread"
+        )
+        self._store_thread.start()
         # Initialize scoring API state
         self.validators_miner_commits: dict[
             tuple[int, str], dict[tuple[int, str], dict[str, MinerChallengeCommit]]
         ] = {}
         self.miner_commits: dict[tuple[int, str], dict[str, MinerChallengeCommit]] = {}
+        self.miner_commits_by_challenge: dict[str, list[MinerChallengeCommit]] = {}
         # Initialize challenge managers
         self.challenge_managers: dict[str, ChallengeManager] = {}
         self.active_challenges: dict = {}
@@ -111,9 +225,11 @@ class ScoringApi(BaseScoringApi):
         # Sync the cache from scoring results retrieved from storage upon initialization
         self._sync_scoring_results_from_storage_to_cache()
 
-        bt.logging.info(
-            f"Scoring API constant values: {self.config.model_dump_json(indent=2)}"
-        )
+        # Compact config is already logged by setup_logging, pretty-print only when debugging
+        if self.is_debug_logging():
+            bt.logging.debug(
+                f"Scoring API constant values: {self.config.model_dump_json(indent=2)}"
+            )
 
     def load_state(self, state: dict) -> None:
         # Load scoring dates
@@ -140,6 +256,9 @@ class ScoringApi(BaseScoringApi):
                     self.miner_commits.setdefault(
                         (miner_state.miner_uid, miner_state.miner_hotkey), {}
                     )[challenge_name] = miner_state.latest_commit
+                    self.miner_commits_by_challenge.setdefault(
+                        challenge_name, []
+                    ).append(miner_state.latest_commit)
 
     def _fetch_miners_docker_info_from_storage(self) -> dict[str, dict]:
         """
@@ -228,17 +347,17 @@ class ScoringApi(BaseScoringApi):
                     metagraph=self.metagraph,
                 )
 
-        self.challenge_managers = {
-            challenge: self.challenge_managers[challenge]
+        # Drop managers of inactive challenges in place
+        stale_challenges = [
+            challenge
             for challenge in self.challenge_managers
-            if challenge in self.active_challenges
-        }
+            if challenge not in self.active_challenges
+        ]
+        for challenge in stale_challenges:
+            del self.challenge_managers[challenge]
 
     def _is_current_metagraph_miner(self, miner_uid: int, miner_hotkey: str) -> bool:
-        return (
-            0 <= miner_uid < len(self.metagraph.hotkeys)
-            and self.metagraph.hotkeys[miner_uid] == miner_hotkey
-        )
+        return self._hotkey_by_uid.get(miner_uid) == miner_hotkey
 
     def get_revealed_commits(self) -> dict[str, list[MinerChallengeCommit]]:
         """
@@ -250,6 +369,11 @@ class ScoringApi(BaseScoringApi):
             A dictionary where the key is the challenge name and the value is a list of MinerChallengeCommit.
         """
         seen_docker_hub_ids: set[str] = set()
+        # Fetch scored docker_hub_ids once per challenge instead of once per commit
+        scored_docker_hub_ids: dict[str, frozenset[str]] = {
+            challenge_name: frozenset(manager.get_unique_scored_docker_hub_ids())
+            for challenge_name, manager in self.challenge_managers.items()
+        }
 
         miner_challenge_commits: dict[
             tuple[int, str, str], list[MinerChallengeCommit]
@@ -263,14 +387,14 @@ class ScoringApi(BaseScoringApi):
 
         for key in miner_challenge_commits:
             miner_challenge_commits[key].sort(
-                key=lambda x: (
-                    x.commit_timestamp if x.commit_timestamp else float("inf")
-                ),
+                key=lambda x: x.commit_timestamp or _INF,
                 reverse=True,
             )
             miner_challenge_commits[key] = miner_challenge_commits[key][:2]
 
-        revealed_commits: dict[str, list[MinerChallengeCommit]] = {}
+        revealed_commits: dict[str, list[MinerChallengeCommit]] = {
+            challenge_name: [] for challenge_name in self.challenge_managers
+        }
         _list_existing_commits = []
         _list_revealed_commits = []
         _list_skipped_commits = []
@@ -286,17 +410,18 @@ class ScoringApi(BaseScoringApi):
                     f"[GET REVEALED COMMITS] Try to reveal commit: {uid} - {hotkey} - {challenge_name} - {commit.encrypted_commit}"
                 )
                 if commit.commit:
-                    this_challenge_revealed_commits = revealed_commits.setdefault(
-                        challenge_name, []
-                    )
-                    docker_hub_id = commit.commit.split("---")[1]
+                    _, separator, remainder = commit.commit.partition("---")
+                    if not separator:
+                        # Malformed commit without a docker_hub_id segment
+                        _list_skipped_commits.append(
+                            f"{challenge_name}-{uid}-{hotkey}-malformed"
+                        )
+                        continue
+                    docker_hub_id = remainder.partition("---")[0]
 
                     if (
                         docker_hub_id in seen_docker_hub_ids
-                        or docker_hub_id
-                        in self.challenge_managers[
-                            challenge_name
-                        ].get_unique_scored_docker_hub_ids()
+                        or docker_hub_id in scored_docker_hub_ids[challenge_name]
                     ):
                         _list_existing_commits.append(
                             f"{challenge_name}-{uid}-{hotkey}-{docker_hub_id}"
@@ -304,27 +429,29 @@ class ScoringApi(BaseScoringApi):
                         continue
                     else:
                         commit.docker_hub_id = docker_hub_id
-                        this_challenge_revealed_commits.append(commit)
+                        revealed_commits[challenge_name].append(commit)
                         seen_docker_hub_ids.add(docker_hub_id)
                         _list_revealed_commits.append(
                             f"{challenge_name}-{uid}-{hotkey}-{docker_hub_id}"
                         )
                 else:
                     _list_skipped_commits.append(f"{challenge_name}-{uid}-{hotkey}")
-        for list_name, list_data in [
-            ("Existing", sorted(_list_existing_commits)),
-            ("Revealed", sorted(_list_revealed_commits)),
-            ("Skipped", sorted(_list_skipped_commits)),
-        ]:
+        # Build a single summary log, sorting each section in place
+        log_lines: list[str] = []
+        for list_name, list_data in (
+            ("Existing", _list_existing_commits),
+            ("Revealed", _list_revealed_commits),
+            ("Skipped", _list_skipped_commits),
+        ):
             if list_data:
-                newline = "\n"  # Define newline character separately
-                bt.logging.info(
-                    f"[GET REVEALED COMMITS] {list_name} commits: {newline.join(list_data)}"
-                )
+                list_data.sort()
+                log_lines.append(f"[GET REVEALED COMMITS] {list_name} commits:")
+                log_lines.extend(list_data)
             else:
-                bt.logging.info(
+                log_lines.append(
                     f"[GET REVEALED COMMITS] No {list_name.lower()} commits"
                 )
+        bt.logging.info("\n".join(log_lines))
 
         return revealed_commits
 
@@ -332,34 +459,93 @@ class ScoringApi(BaseScoringApi):
         self, miner_commits: dict[str, list[MinerChallengeCommit]] = None
     ):
         """
-        Store miner commits to storage.
+        Queue miner commits to be stored by the background store worker.
+        Drops the batch with an error log if the queue is full instead of blocking.
         """
         if not miner_commits:
-            miner_commits = {}
             bt.logging.info(
                 "[STORE MINER COMMMITS] Storing all commits in self.miner_commits"
             )
-            for _, miner_challenge_commits in self.miner_commits.items():
-                for challenge_name, commit in miner_challenge_commits.items():
-                    miner_commits.setdefault(challenge_name, []).append(commit)
-
-        data_to_store: list[MinerChallengeCommit] = [
-            commit
-            for _, commits in miner_commits.items()
-            for commit in commits
-            if self._is_current_metagraph_miner(commit.miner_uid, commit.miner_hotkey)
-        ]
-
-        bt.logging.info(
-            f"[STORE MINER COMMMITS] Storing {len(data_to_store)} commits to storage: {[commit.encrypted_commit[:15] for commit in data_to_store]}"
-        )
+            miner_commits = self.miner_commits_by_challenge
 
         try:
-            self.storage_manager.update_commit_batch(
-                commits=data_to_store, async_update=True
+            self._store_queue.put_nowait(miner_commits)
+        except queue.Full:
+            bt.logging.error(
+                f"[STORE MINER COMMMITS] Store queue is full, dropping commits for challenges: {list(miner_commits.keys())}"
             )
-        except Exception as e:
-            bt.logging.error(f"Failed to queue miner commit data for storage: {e}")
+
+    def _store_worker(self):
+        """
+        Drain the store queue, coalescing batches already queued into a single
+        update_commit_batch call. Exits after storing everything queued before
+        the None stop sentinel.
+        """
+        while True:
+            batches: list[dict[str, list[MinerChallengeCommit]]] = []
+            should_stop = False
+            item = self._store_queue.get()
+            while True:
+                if item is None:
+                    should_stop = True
+                else:
+                    batches.append(item)
+                try:
+                    item = self._store_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batches:
+                try:
+                    data_to_store: list[MinerChallengeCommit] = [
+                        commit
+                        for miner_commits in batches
+                        for commits in miner_commits.values()
+                        for commit in commits
+                        if self._is_current_metagraph_miner(
+                            commit.miner_uid, commit.miner_hotkey
+                        )
+                    ]
+
+                    bt.logging.info(
+                        f"[STORE MINER COMMMITS] Storing {len(data_to_store)} commits to storage: {[commit.encrypted_commit[:15] for commit in data_to_store]}"
+                    )
+
+                    self.storage_manager.update_commit_batch(
+                        commits=data_to_store, async_update=True
+                    )
+                except Exception as e:
+                    bt.logging.error(
+                        f"[STORE MINER COMMMITS] Failed to store miner commit data: {e}"
+                    )
+
+            if should_stop:
+                return
+
+    def _stop_store_worker(self):
+        """
+        Stop the store worker after it has stored all pending miner commits.
+        """
+        if not self._store_thread.is_alive():
+            return
+
+        if self.forward_thread and self.forward_thread.is_alive():
+            bt.logging.warning(
+                "[STORE MINER COMMMITS] Forward thread is still running, miner commits it queues after the flush will not be stored"
+            )
+
+        bt.logging.info("[STORE MINER COMMMITS] Flushing pending miner commits...")
+        self._store_queue.put(None)
+        self._store_thread.join(timeout=STORE_WORKER_JOIN_TIMEOUT)
+        if self._store_thread.is_alive():
+            bt.logging.warning(
+                "[STORE MINER COMMMITS] Store worker did not finish flushing in time"
+            )
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Stop the run loop and forward thread first so no more commits are queued
+        super().__exit__(exc_type, exc_value, traceback)
+        self._stop_store_worker()
 
     def export_state(self, public_view: bool = False) -> dict:
         """
@@ -418,14 +604,8 @@ class ScoringApi(BaseScoringApi):
 
         # Update miner infos
         for challenge_name, challenge_manager in self.challenge_managers.items():
-            miner_commits_for_this_challenge = []
-            for (uid, hotkey), commits in self.miner_commits.items():
-                for _challenge_name, commit in commits.items():
-                    if _challenge_name == challenge_name:
-                        miner_commits_for_this_challenge.append(commit)
-
             challenge_manager.update_miner_infos(
-                miner_commits=miner_commits_for_this_challenge
+                miner_commits=self.miner_commits_by_challenge.get(challenge_name, [])
             )
         bt.logging.success(
             f"[CENTRALIZED SCORING] Miner infos in challenge managers updated for {date_time}"
@@ -510,13 +690,11 @@ class ScoringApi(BaseScoringApi):
         # Also construct input seeds for new commits, this will be using input from commits that in the same revealed list for comparison
         # We do this since commits being in the same revealed list means that they will be scored in same day
         new_commits: list[MinerChallengeCommit] = []
-        seed_inputs: list[dict] = []
-
-        input_seed_hashes_set: set[str] = set()
+        # Seed inputs keyed by input hash, first occurrence wins
+        seed_inputs_by_hash: dict[str, dict] = {}
+        already_scored = self.scoring_results.keys_for_challenge(challenge)
         for commit in revealed_commits_list:
-            if commit.docker_hub_id in self.scoring_results.get_all_for_challenge(
-                challenge
-            ):
+            if commit.docker_hub_id in already_scored:
                 cached_result = self.scoring_results.get(
                     challenge=challenge, docker_hub_id=commit.docker_hub_id
                 )
@@ -526,14 +704,12 @@ class ScoringApi(BaseScoringApi):
                 if cached_result.get("scored_timestamp"):
                     commit.scored_timestamp = cached_result["scored_timestamp"]
 
-                # Add input seed hash to set
+                # Collect seed inputs by input hash
                 for scoring_log in commit.scoring_logs:
-                    if (
-                        scoring_log.input_hash
-                        and scoring_log.input_hash not in input_seed_hashes_set
-                    ):
-                        input_seed_hashes_set.add(scoring_log.input_hash)
-                        seed_inputs.append(scoring_log.miner_input)
+                    if scoring_log.input_hash:
+                        seed_inputs_by_hash.setdefault(
+                            scoring_log.input_hash, scoring_log.miner_input
+                        )
             else:
                 new_commits.append(commit)
 
@@ -549,9 +725,7 @@ class ScoringApi(BaseScoringApi):
         else:
             _sorted_new_miner_commits = sorted(
                 new_commits,
-                key=lambda x: (
-                    x.commit_timestamp if x.commit_timestamp else float("inf")
-                ),
+                key=lambda x: x.commit_timestamp or _INF,
             )
             bt.logging.info(
                 f"[CENTRALIZED SCORING] {len(_sorted_new_miner_commits)} new commits to score for challenge: {challenge}"
@@ -581,7 +755,7 @@ class ScoringApi(BaseScoringApi):
             miner_commits=_sorted_new_miner_commits,
             reference_comparison_commits=_accepted_commits,
             challenge_info=self.active_challenges[challenge],
-            seed_inputs=seed_inputs,
+            seed_inputs=list(seed_inputs_by_hash.values()),
         )
         # Run challenge controller, the controller update commit 's scoring logs and reference comparison logs directly
         controller.start_challenge()
@@ -614,8 +788,25 @@ class ScoringApi(BaseScoringApi):
                 bt.logging.success("Keyboard interrupt detected. Exiting validator.")
                 exit()
 
-            # Sleep until next weight update
-            time.sleep(self.config.EPOCH_LENGTH)
+            # Sleep until next weight update, waking early on shutdown
+            if self._shutdown.wait(timeout=self.config.EPOCH_LENGTH):
+                break
+
+    def _signed_post(self, endpoint: str, data: dict) -> requests.Response:
+        """
+        POST data to storage over the shared session with a signed validator header.
+        Safe to call from worker threads, keypair signing holds no shared state.
+        """
+        headers = {
+            **self.validator_request_header_fn(data),
+            "Content-Type": "application/json",
+        }
+        return self._http.post(
+            endpoint,
+            headers=headers,
+            data=orjson.dumps(data, option=_ORJSON_DUMPS_OPTIONS),
+            timeout=HTTP_REQUEST_TIMEOUT,
+        )
 
     # MARK: Commit Management
     def _update_validators_miner_commits(self):
@@ -630,11 +821,13 @@ class ScoringApi(BaseScoringApi):
            - Store in self.validators_miner_commits with validator (uid, hotkey) as key
         """
         # Get list of valid validators based on stake
-        valid_validators = []
-        for validator_uid, validator_ss58_address in enumerate(self.metagraph.hotkeys):
-            stake = self.metagraph.S[validator_uid]
-            if stake >= self.config.MIN_VALIDATOR_STAKE:
-                valid_validators.append((validator_uid, validator_ss58_address))
+        valid_validator_uids: list[int] = np.flatnonzero(
+            np.asarray(self.metagraph.S) >= self.config.MIN_VALIDATOR_STAKE
+        ).tolist()
+        valid_validators = [
+            (validator_uid, self.metagraph.hotkeys[validator_uid])
+            for validator_uid in valid_validator_uids
+        ]
 
         bt.logging.info(
             f"[CENTRALIZED COMMIT UPDATES] Found {len(valid_validators)} valid validators"
@@ -642,89 +835,124 @@ class ScoringApi(BaseScoringApi):
 
         # Initialize/clear validators_miner_commits for this round
         self.validators_miner_commits = {}
-        self.miner_commits_cache: dict[str, MinerChallengeCommit] = {}
+        self.miner_commits_cache: dict[tuple[str, str], MinerChallengeCommit] = {}
 
-        for validator_uid, validator_hotkey in valid_validators:
-            # Skip if request fails
-            try:
-                storage_url = str(self.config.STORAGE_API_URL).rstrip("/")
-                endpoint = f"{storage_url}/fetch-latest-miner-commits"
+        storage_url = str(self.config.STORAGE_API_URL).rstrip("/")
+        endpoint = f"{storage_url}/fetch-latest-miner-commits"
+        challenge_names = list(self.active_challenges.keys())
+
+        # Fetch from all validators concurrently, only signing and the HTTP round trip run in worker threads
+        responses: dict[tuple[int, str], requests.Response] = {}
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(VALIDATOR_FETCH_MAX_WORKERS, len(valid_validators)))
+        ) as executor:
+            futures = {}
+            for validator_uid, validator_hotkey in valid_validators:
                 data = {
                     "validator_uid": validator_uid,
                     "validator_hotkey": validator_hotkey,
-                    "challenge_names": list(self.active_challenges.keys()),
+                    "challenge_names": challenge_names,
                 }
-                response = requests.post(
-                    endpoint, headers=self.validator_request_header_fn(data), json=data
+                future = executor.submit(self._signed_post, endpoint, data)
+                futures[future] = (validator_uid, validator_hotkey)
+
+            for future in as_completed(futures):
+                validator_uid, validator_hotkey = futures[future]
+                # Skip if request fails
+                try:
+                    response = future.result()
+                    response.raise_for_status()
+                    responses[(validator_uid, validator_hotkey)] = response
+                except Exception:
+                    bt.logging.warning(
+                        f"[CENTRALIZED COMMIT UPDATES] Failed to fetch data for validator {validator_uid}, hotkey: {validator_hotkey}: {traceback.format_exc()}"
+                    )
+
+        # Process responses in validator order to keep aggregation deterministic
+        for validator_uid, validator_hotkey in valid_validators:
+            if (validator_uid, validator_hotkey) not in responses:
+                continue
+
+            try:
+                data = orjson.loads(
+                    responses[(validator_uid, validator_hotkey)].content
                 )
-                response.raise_for_status()
-                # Only continue if response is successful
-                data = response.json()
                 this_validator_miner_commits: dict[
                     tuple[int, str], dict[str, MinerChallengeCommit]
                 ] = {}
-                # Process miner submissions for this validator
+                # Flatten commits of current miners so they are validated in a single call
+                commit_groups: list[tuple[str, bool, int]] = []
+                raw_commits: list[dict] = []
                 for miner_hotkey, miner_commits in data["miner_commits"].items():
-                    if miner_hotkey not in self.metagraph.hotkeys:
+                    if miner_hotkey not in self._hotkey_set:
                         # Skip if miner hotkey is not in metagraph
                         continue
 
                     for challenge_name, miner_commit in miner_commits.items():
                         if isinstance(miner_commit, list):
-                            miner_commit_objs = []
-                            for commit_data in miner_commit:
-                                miner_commit_obj = MinerChallengeCommit.model_validate(
-                                    commit_data
-                                )
-                                miner_commit_objs.append(miner_commit_obj)
-                                cache_key = f"{miner_commit_obj.challenge_name}---{miner_commit_obj.encrypted_commit}"
-                                if cache_key not in self.miner_commits_cache:
+                            commit_groups.append(
+                                (challenge_name, True, len(miner_commit))
+                            )
+                            raw_commits.extend(miner_commit)
+                        else:
+                            commit_groups.append((challenge_name, False, 1))
+                            raw_commits.append(miner_commit)
+
+                validated_commits = _COMMIT_LIST_ADAPTER.validate_python(raw_commits)
+
+                # Process miner submissions for this validator
+                offset = 0
+                for challenge_name, is_list, count in commit_groups:
+                    miner_commit_objs = validated_commits[offset : offset + count]
+                    offset += count
+
+                    if is_list:
+                        for miner_commit_obj in miner_commit_objs:
+                            cache_key = (
+                                miner_commit_obj.challenge_name,
+                                miner_commit_obj.encrypted_commit,
+                            )
+                            existing = self.miner_commits_cache.get(cache_key)
+                            if existing is None:
+                                self.miner_commits_cache[cache_key] = miner_commit_obj
+                            else:
+                                if (
+                                    miner_commit_obj.commit_timestamp
+                                    and existing.commit_timestamp
+                                    and miner_commit_obj.commit_timestamp
+                                    < existing.commit_timestamp
+                                ):
                                     self.miner_commits_cache[cache_key] = (
                                         miner_commit_obj
                                     )
-                                else:
-                                    existing = self.miner_commits_cache[cache_key]
-                                    if (
-                                        miner_commit_obj.commit_timestamp
-                                        and existing.commit_timestamp
-                                        and miner_commit_obj.commit_timestamp
-                                        < existing.commit_timestamp
-                                    ):
-                                        self.miner_commits_cache[cache_key] = (
-                                            miner_commit_obj
-                                        )
-
-                            if miner_commit_objs:
-                                latest_commit = max(
-                                    miner_commit_objs,
-                                    key=lambda x: (
-                                        x.commit_timestamp
-                                        if x.commit_timestamp
-                                        else float("-inf")
-                                    ),
-                                )
-                                miner_key = (
-                                    latest_commit.miner_uid,
-                                    latest_commit.miner_hotkey,
-                                )
-                                this_validator_miner_commits.setdefault(miner_key, {})[
-                                    challenge_name
-                                ] = latest_commit
-                        else:
-                            miner_commit_obj = MinerChallengeCommit.model_validate(
-                                miner_commit
+
+                        if miner_commit_objs:
+                            latest_commit = max(
+                                miner_commit_objs,
+                                key=lambda x: x.commit_timestamp or -_INF,
                             )
-                            this_validator_miner_commits.setdefault(
-                                (
-                                    miner_commit_obj.miner_uid,
-                                    miner_commit_obj.miner_hotkey,
-                                ),
-                                {},
-                            )[miner_commit_obj.challenge_name] = miner_commit_obj
-
-                            cache_key = f"{miner_commit_obj.challenge_name}---{miner_commit_obj.encrypted_commit}"
-                            if cache_key not in self.miner_commits_cache:
-                                self.miner_commits_cache[cache_key] = miner_commit_obj
+                            miner_key = (
+                                latest_commit.miner_uid,
+                                latest_commit.miner_hotkey,
+                            )
+                            this_validator_miner_commits.setdefault(miner_key, {})[
+                                challenge_name
+                            ] = latest_commit
+                    else:
+                        miner_commit_obj = miner_commit_objs[0]
+                        this_validator_miner_commits.setdefault(
+                            (
+                                miner_commit_obj.miner_uid,
+                                miner_commit_obj.miner_hotkey,
+                            ),
+                            {},
+                        )[miner_commit_obj.challenge_name] = miner_commit_obj
+
+                        cache_key = (
+                            miner_commit_obj.challenge_name,
+                            miner_commit_obj.encrypted_commit,
+                        )
+                        self.miner_commits_cache.setdefault(cache_key, miner_commit_obj)
 
                 self.validators_miner_commits[(validator_uid, validator_hotkey)] = (
                     this_validator_miner_commits
@@ -735,7 +963,7 @@ class ScoringApi(BaseScoringApi):
 
             except Exception:
                 bt.logging.warning(
-                    f"[CENTRALIZED COMMIT UPDATES] Failed to fetch data for validator {validator_uid}, hotkey: {validator_hotkey}: {traceback.format_exc()}"
+                    f"[CENTRALIZED COMMIT UPDATES] Failed to process data for validator {validator_uid}, hotkey: {validator_hotkey}: {traceback.format_exc()}"
                 )
                 continue
 
@@ -758,10 +986,11 @@ class ScoringApi(BaseScoringApi):
              * Keep newer one based on timestamp
         3. Merge scoring data from existing state for unchanged commits
         4. Sort and store self.miner_commits by miner uid and hotkey for deterministic ordering
+        5. Index the aggregated commits by challenge name in self.miner_commits_by_challenge
         """
-        new_miner_commits: dict[tuple[int, str], dict[str, MinerChallengeCommit]] = {}
-
-        for _, miner_commits_from_validator in self.validators_miner_commits.items():
+        # Reduce all validators' commits to the best commit per miner and challenge
+        best_commits: dict[tuple[int, str, str], MinerChallengeCommit] = {}
+        for miner_commits_from_validator in self.validators_miner_commits.values():
             for (
                 miner_uid,
                 miner_hotkey,
@@ -769,60 +998,29 @@ class ScoringApi(BaseScoringApi):
                 if not self._is_current_metagraph_miner(miner_uid, miner_hotkey):
                     continue
 
-                miner_key = (miner_uid, miner_hotkey)
+                for challenge_name, miner_commit in miner_commits_in_challenges.items():
+                    key = (miner_uid, miner_hotkey, challenge_name)
+                    current_miner_commit = best_commits.get(key)
+                    best_commits[key] = (
+                        miner_commit
+                        if current_miner_commit is None
+                        else _merge_miner_commit(current_miner_commit, miner_commit)
+                    )
 
-                if miner_key not in new_miner_commits:
-                    new_miner_commits[miner_key] = miner_commits_in_challenges
-                else:
-                    for (
-                        challenge_name,
-                        miner_commit,
-                    ) in miner_commits_in_challenges.items():
-                        if challenge_name not in new_miner_commits[miner_key]:
-                            new_miner_commits[miner_key][challenge_name] = miner_commit
-                        else:
-                            current_miner_commit = new_miner_commits[miner_key][
-                                challenge_name
-                            ]
-                            if (
-                                miner_commit.encrypted_commit
-                                == current_miner_commit.encrypted_commit
-                            ):
-                                if (
-                                    miner_commit.commit_timestamp
-                                    and current_miner_commit.commit_timestamp
-                                    and miner_commit.commit_timestamp
-                                    < current_miner_commit.commit_timestamp
-                                ):
-                                    current_miner_commit.commit_timestamp = (
-                                        miner_commit.commit_timestamp
-                                    )
-                                if not current_miner_commit.key:
-                                    current_miner_commit.key = miner_commit.key
-                                if not current_miner_commit.commit:
-                                    current_miner_commit.commit = miner_commit.commit
-                            else:
-                                if (
-                                    miner_commit.commit_timestamp
-                                    and current_miner_commit.commit_timestamp
-                                    and miner_commit.commit_timestamp
-                                    > current_miner_commit.commit_timestamp
-                                ):
-                                    new_miner_commits[miner_key][
-                                        challenge_name
-                                    ] = miner_commit
-                                else:
-                                    continue
-
-        for miner_key, existing_challenges in self.miner_commits.items():
-            if miner_key not in new_miner_commits:
-                continue
+        new_miner_commits: dict[tuple[int, str], dict[str, MinerChallengeCommit]] = {}
+        for (miner_uid, miner_hotkey, challenge_name), commit in best_commits.items():
+            new_miner_commits.setdefault((miner_uid, miner_hotkey), {})[
+                challenge_name
+            ] = commit
 
-            for challenge_name, existing_commit in existing_challenges.items():
-                if challenge_name not in new_miner_commits[miner_key]:
-                    continue
+        # Only miners and challenges present in both states can carry over scoring data
+        for miner_key in self.miner_commits.keys() & new_miner_commits.keys():
+            existing_challenges = self.miner_commits[miner_key]
+            new_challenges = new_miner_commits[miner_key]
 
-                new_commit = new_miner_commits[miner_key][challenge_name]
+            for challenge_name in existing_challenges.keys() & new_challenges.keys():
+                existing_commit = existing_challenges[challenge_name]
+                new_commit = new_challenges[challenge_name]
                 if existing_commit.encrypted_commit == new_commit.encrypted_commit:
                     new_commit.scoring_logs = existing_commit.scoring_logs
                     new_commit.comparison_logs = existing_commit.comparison_logs
@@ -830,14 +1028,18 @@ class ScoringApi(BaseScoringApi):
                     new_commit.penalty = existing_commit.penalty
                     new_commit.accepted = existing_commit.accepted
                     new_commit.scored_timestamp = existing_commit.scored_timestamp
-        self.miner_commits = new_miner_commits
 
-        self.miner_commits = {
-            (uid, ss58_address): commits
-            for (uid, ss58_address), commits in sorted(
-                self.miner_commits.items(), key=lambda item: item[0]
-            )
-        }
+        # Sort once by miner uid and hotkey, then build the dict and challenge index from it
+        sorted_miner_commits = sorted(new_miner_commits.items(), key=itemgetter(0))
+        self.miner_commits = dict(sorted_miner_commits)
+
+        miner_commits_by_challenge: defaultdict[str, list[MinerChallengeCommit]] = (
+            defaultdict(list)
+        )
+        for _, commits in sorted_miner_commits:
+            for challenge_name, commit in commits.items():
+                miner_commits_by_challenge[challenge_name].append(commit)
+        self.miner_commits_by_challenge = dict(miner_commits_by_challenge)
 
     # MARK: Storage
     def _store_centralized_scoring(self, challenge_name: str = None):
@@ -862,59 +1064,86 @@ class ScoringApi(BaseScoringApi):
 
         for challenge_name in challenge_names:
             scoring_results_to_send: list[dict] = []
-            # Send batch of maximum 5 results at a time to avoid huge payload
+            # Each result is serialized once, the parts are reused for the request body
+            serialized_results: list[bytes] = []
+            batch_bytes = 0
+            # Send batches bounded by count and size to avoid huge payloads
             for docker_hub_id, result in self.scoring_results.get_all_for_challenge(
                 challenge_name
             ).items():
                 scoring_result = {
                     "challenge_name": challenge_name,
                     "docker_hub_id": docker_hub_id,
-                    "scoring_logs": [
-                        scoring_log.model_dump()
-                        for scoring_log in result.get("scoring_logs", [])
-                    ],
-                    "comparison_logs": {
-                        docker_hub_id: [
-                            comparison_log.model_dump()
-                            for comparison_log in _comparison_logs
-                        ]
-                        for docker_hub_id, _comparison_logs in result.get(
-                            "comparison_logs", {}
-                        ).items()
-                    },
+                    "scoring_logs": _SCORING_LOG_LIST_ADAPTER.dump_python(
+                        result.get("scoring_logs", [])
+                    ),
+                    "comparison_logs": _COMPARISON_LOG_MAP_ADAPTER.dump_python(
+                        result.get("comparison_logs", {})
+                    ),
                     "scored_timestamp": result.get("scored_timestamp"),
                 }
-                scoring_results_to_send.append(scoring_result)
-
-                if len(scoring_results_to_send) >= 5:
-                    try:
-                        data = {"scoring_results": scoring_results_to_send}
-                        response = requests.post(
-                            endpoint,
-                            headers=self.validator_request_header_fn(data),
-                            json=data,
-                        )
-                        response.raise_for_status()
-                        scoring_results_to_send = []
-                    except Exception:
-                        bt.logging.error(
-                            f"Failed to send scoring results to storage: {traceback.format_exc()}"
-                        )
-                        scoring_results_to_send = []
-
-            if scoring_results_to_send:
                 try:
-                    data = {"scoring_results": scoring_results_to_send}
-                    response = requests.post(
-                        endpoint,
-                        headers=self.validator_request_header_fn(data),
-                        json=data,
+                    serialized_result = orjson.dumps(
+                        scoring_result, option=_ORJSON_DUMPS_OPTIONS
                     )
-                    response.raise_for_status()
                 except Exception:
+                    # Skip only this result so the rest of the challenge is still sent
                     bt.logging.error(
-                        f"Failed to send scoring results to storage: {traceback.format_exc()}"
+                        f"[CENTRALIZED SCORING] Failed to serialize scoring result for {docker_hub_id} in challenge {challenge_name}, skipping: {traceback.format_exc()}"
+                    )
+                    continue
+                scoring_results_to_send.append(scoring_result)
+                serialized_results.append(serialized_result)
+                batch_bytes += len(serialized_result)
+
+                if (
+                    len(scoring_results_to_send) >= SCORING_RESULTS_BATCH_SIZE
+                    or batch_bytes >= SCORING_RESULTS_BATCH_MAX_BYTES
+                ):
+                    self._post_scoring_results(
+                        endpoint, scoring_results_to_send, serialized_results
                     )
+                    scoring_results_to_send = []
+                    serialized_results = []
+                    batch_bytes = 0
+
+            if scoring_results_to_send:
+                self._post_scoring_results(
+                    endpoint, scoring_results_to_send, serialized_results
+                )
+
+    def _post_scoring_results(
+        self,
+        endpoint: str,
+        scoring_results: list[dict],
+        serialized_results: list[bytes],
+    ):
+        """
+        Send one batch of scoring results to centralized storage.
+
+        Args:
+            endpoint (str): Upload endpoint
+            scoring_results (list[dict]): Scoring results in the batch, used to sign the request
+            serialized_results (list[bytes]): JSON encoded scoring results, used as the request body
+        """
+        try:
+            data = {"scoring_results": scoring_results}
+            body = b'{"scoring_results":[' + b",".join(serialized_results) + b"]}"
+            headers = {
+                **self.validator_request_header_fn(data),
+                "Content-Type": "application/json",
+            }
+            response = self._upload_http.post(
+                endpoint,
+                headers=headers,
+                data=body,
+                timeout=HTTP_REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+        except Exception:
+            bt.logging.error(
+                f"Failed to send scoring results to storage: {traceback.format_exc()}"
+            )
 
     def _get_accepted_challenge_commits(self, challenge_name: str) -> list:
         _payload = {"challenge_name": challenge_name}
@@ -932,6 +1161,14 @@ class ScoringApi(BaseScoringApi):
                 bt.logging.warning(
                     f"No accepted challenge commits found for {challenge_name}"
                 )
+            try:
+                return _COMMIT_LIST_ADAPTER.validate_python(
+                    [commit_data["commits"][0] for commit_data in commits]
+                )
+            except (ValidationError, KeyError, IndexError, TypeError):
+                # Fall back to per-item validation to skip only the invalid commits
+                pass
+
             _accepted_commits: list[MinerChallengeCommit] = []
             for commit_data in commits:
                 try:
@@ -950,81 +1187,91 @@ class ScoringApi(BaseScoringApi):
             )
             return []
 
+    def _fetch_challenge_scoring_results(self, challenge_name: str) -> list[dict]:
+        """
+        Fetch the most recent scoring results for a challenge from centralized storage.
+
+        Args:
+            challenge_name (str): Challenge to fetch scoring results for
+
+        Returns:
+            list[dict]: Raw scoring results, most recent first
+        """
+        # Request the most recent entries for this challenge
+        entries_per_challenge = 256  # Match the LRU cache size
+
+        storage_url = str(self.config.STORAGE_API_URL).rstrip("/")
+        endpoint = f"{storage_url}/fetch-centralized-score"
+        data = {
+            "challenge_names": [challenge_name],
+            "limit": entries_per_challenge,  # Get the most recent entries
+            "full_results": False,  # Apply date filtering for recency
+            "get_detailed_results": True,  # Get full details
+        }
+
+        bt.logging.info(
+            f"[CENTRALIZED SCORING] Fetching up to {entries_per_challenge} scoring results for challenge {challenge_name}"
+        )
+
+        response = self._signed_post(endpoint, data)
+        response.raise_for_status()
+        return orjson.loads(response.content)["data"]
+
     def _initialize_scoring_cache(self):
         """
         Initialize the scoring LRU cache with the most recent data from centralized storage.
         Uses the limit parameter to get only the most recent data per challenge.
+        Challenges are fetched concurrently and loaded as each fetch completes,
+        the cache itself is only written from this thread.
         """
         bt.logging.info(
             "[CENTRALIZED SCORING] Initializing scoring LRU cache from storage"
         )
 
-        # Process each challenge separately to manage memory usage
-        for challenge_name in self.active_challenges.keys():
-            try:
-                # Request the most recent entries for this challenge
-                entries_per_challenge = 256  # Match the LRU cache size
-
-                storage_url = str(self.config.STORAGE_API_URL).rstrip("/")
-                endpoint = f"{storage_url}/fetch-centralized-score"
-                data = {
-                    "challenge_names": [challenge_name],
-                    "limit": entries_per_challenge,  # Get the most recent entries
-                    "full_results": False,  # Apply date filtering for recency
-                    "get_detailed_results": True,  # Get full details
-                }
+        challenge_names = list(self.active_challenges.keys())
+        with ThreadPoolExecutor(
+            max_workers=max(
+                1, min(SCORING_CACHE_FETCH_MAX_WORKERS, len(challenge_names))
+            )
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._fetch_challenge_scoring_results, challenge_name
+                ): challenge_name
+                for challenge_name in challenge_names
+            }
+
+            # Process each challenge as soon as it arrives and drop its future, so each
+            # response is released once loaded instead of holding all of them until the end
+            for future in as_completed(futures):
+                challenge_name = futures.pop(future)
+                try:
+                    results = future.result()
 
-                bt.logging.info(
-                    f"[CENTRALIZED SCORING] Fetching up to {entries_per_challenge} scoring results for challenge {challenge_name}"
-                )
+                    if not results:
+                        bt.logging.info(
+                            f"[CENTRALIZED SCORING] No scoring results found for challenge {challenge_name}"
+                        )
+                        continue
 
-                response = requests.post(
-                    endpoint, headers=self.validator_request_header_fn(data), json=data
-                )
-                response.raise_for_status()
-                results = response.json()["data"]
+                    # Store in our LRU cache in one batch
+                    self.scoring_results.set_many(
+                        challenge=challenge_name,
+                        items=(
+                            (result["docker_hub_id"], _validate_scoring_result(result))
+                            for result in results
+                        ),
+                    )
+                    loaded_count = len(results)
 
-                if not results:
                     bt.logging.info(
-                        f"[CENTRALIZED SCORING] No scoring results found for challenge {challenge_name}"
+                        f"[CENTRALIZED SCORING] Loaded {loaded_count} scoring results for challenge {challenge_name}"
                     )
-                    continue
 
-                loaded_count = 0
-                for result in results:
-                    processed_result = {
-                        "scoring_logs": [
-                            ScoringLog.model_validate(scoring_log)
-                            for scoring_log in result["scoring_logs"]
-                        ],
-                        "comparison_logs": {
-                            docker_hub_id: [
-                                ComparisonLog.model_validate(comparison_log)
-                                for comparison_log in _comparison_logs
-                            ]
-                            for docker_hub_id, _comparison_logs in result[
-                                "comparison_logs"
-                            ].items()
-                        },
-                        "scored_timestamp": result.get("scored_timestamp"),
-                    }
-
-                    # Store in our LRU cache
-                    self.scoring_results.set(
-                        challenge=challenge_name,
-                        docker_hub_id=result["docker_hub_id"],
-                        result=processed_result,
+                except Exception as e:
+                    bt.logging.error(
+                        f"[CENTRALIZED SCORING] Error initializing scoring cache for challenge {challenge_name}: {traceback.format_exc()}"
                     )
-                    loaded_count += 1
-
-                bt.logging.info(
-                    f"[CENTRALIZED SCORING] Loaded {loaded_count} scoring results for challenge {challenge_name}"
-                )
-
-            except Exception as e:
-                bt.logging.error(
-                    f"[CENTRALIZED SCORING] Error initializing scoring cache for challenge {challenge_name}: {traceback.format_exc()}"
-                )
 
         # Log statistics about the populated cache
         stats = self.scoring_results.get_stats()
@@ -1045,54 +1292,69 @@ class ScoringApi(BaseScoringApi):
             diskcache_ = self.storage_manager._get_cache(challenge_name)
             memcache_ = self.scoring_results.get_all_for_challenge(challenge_name)
 
-            for hashed_cache_key in diskcache_.iterkeys():
-                commit = diskcache_.get(hashed_cache_key)
-                try:
-                    commit = MinerChallengeCommit.model_validate(
-                        commit
-                    )  # Model validate the commit
-                except Exception:
-                    continue
+            if not memcache_:
+                # Nothing in memory to sync from for this challenge
+                continue
 
-                # Check if docker_hub_id is in self.scoring_results
-                if commit.docker_hub_id not in memcache_:
-                    continue
+            # Read and update all entries within a single cache transaction
+            with diskcache_.transact(retry=True):
+                for hashed_cache_key in diskcache_.iterkeys():
+                    raw_commit = diskcache_.get(hashed_cache_key)
+                    if not isinstance(raw_commit, dict):
+                        continue
 
-                # Found the commit in self.scoring_results, now we make sure cache have correct scoring_logs
-                has_changes = False
-                if not commit.scoring_logs:
-                    # If not scoring_logs, we add the scoring_logs from self.scoring_results
-                    commit.scoring_logs = memcache_[commit.docker_hub_id][
-                        "scoring_logs"
-                    ]
-                    has_changes = True
-                else:
-                    # Check for each entries in scoring_logs for miner_input and miner_output, they should not be None
-                    scoring_logs_with_none = []
-                    for scoring_log in commit.scoring_logs:
-                        if (
-                            scoring_log.miner_input is None
-                            or scoring_log.miner_output is None
+                    # Check if docker_hub_id is in self.scoring_results
+                    docker_hub_id = raw_commit.get("docker_hub_id")
+                    if not isinstance(docker_hub_id, str):
+                        continue
+                    cached_result = memcache_.get(docker_hub_id)
+                    if cached_result is None:
+                        continue
+
+                    # Found the commit in self.scoring_results, check the raw entry first and only validate when it needs an update
+                    # Skip malformed entries like validation would, they must not stop the sync
+                    try:
+                        update_scoring_logs = False
+                        raw_scoring_logs = raw_commit.get("scoring_logs")
+                        if not raw_scoring_logs:
+                            # If not scoring_logs, we add the scoring_logs from self.scoring_results
+                            update_scoring_logs = True
+                        elif not isinstance(raw_scoring_logs, list) or not all(
+                            isinstance(scoring_log, dict)
+                            for scoring_log in raw_scoring_logs
                         ):
-                            scoring_logs_with_none.append(scoring_log)
-
-                    # If there are any scoring logs with None, we use the scoring_logs from self.scoring_results and update the cache
-                    if any(scoring_logs_with_none):
-                        commit.scoring_logs = memcache_[commit.docker_hub_id][
-                            "scoring_logs"
-                        ]
-                        has_changes = True
-
-                # Sync scored_timestamp from memory cache to disk cache if missing
-                if not commit.scored_timestamp and memcache_[commit.docker_hub_id].get(
-                    "scored_timestamp"
-                ):
-                    commit.scored_timestamp = memcache_[commit.docker_hub_id][
-                        "scored_timestamp"
-                    ]
-                    has_changes = True
+                            continue
+                        else:
+                            # Check for each entries in scoring_logs for miner_input and miner_output, they should not be None
+                            # If there are any scoring logs with None, we use the scoring_logs from self.scoring_results and update the cache
+                            update_scoring_logs = any(
+                                scoring_log.get("miner_input") is None
+                                or scoring_log.get("miner_output") is None
+                                for scoring_log in raw_scoring_logs
+                            )
+
+                        # Sync scored_timestamp from memory cache to disk cache if missing
+                        update_scored_timestamp = not raw_commit.get(
+                            "scored_timestamp"
+                        ) and bool(cached_result.get("scored_timestamp"))
+                    except Exception:
+                        continue
+
+                    if not (update_scoring_logs or update_scored_timestamp):
+                        continue
+
+                    try:
+                        commit = MinerChallengeCommit.model_validate(
+                            raw_commit
+                        )  # Model validate the commit
+                    except Exception:
+                        continue
+
+                    if update_scoring_logs:
+                        commit.scoring_logs = cached_result["scoring_logs"]
+                    if update_scored_timestamp:
+                        commit.scored_timestamp = cached_result["scored_timestamp"]
 
-                if has_changes:
                     diskcache_[hashed_cache_key] = commit.model_dump()
 
 
@@ -1102,6 +1364,11 @@ if __name__ == "__main__":
     )
     server_thread.start()
     with ScoringApi() as app:
-        while True:
+        # Install handlers only once started, so startup stays interruptible
+        stop_event = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+        signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+        bt.logging.info("ScoringApi is running...")
+        while not stop_event.wait(app.config.EPOCH_LENGTH // 4):
             bt.logging.info("ScoringApi is running...")
-            time.sleep(app.config.EPOCH_LENGTH // 4)
+        bt.logging.success("Shutdown signal received. Exiting scoring API.")
@@ -3,6 +3,7 @@ import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
+from functools import cached_property
 
 import bittensor as bt
 from substrateinterface import SubstrateInterface
@@ -19,9 +20,14 @@ class BaseScoringApi(ABC):
         self.setup_bittensor_objects()
         self.last_update = 0
         self.current_block = 0
-        self.node = SubstrateInterface(url=self.config.BITTENSOR.SUBTENSOR_NETWORK)
         self.is_running = False
         self.forward_thread: threading.Thread = None
+        self._shutdown = threading.Event()
+
+    @cached_property
+    def node(self) -> SubstrateInterface:
+        """Substrate connection, opened on first use."""
+        return SubstrateInterface(url=self.config.BITTENSOR.SUBTENSOR_NETWORK)
 
     def setup_logging(self):
         bt.logging.enable_default()
@@ -35,6 +41,10 @@ class BaseScoringApi(ABC):
         )
         bt.logging.info(self.config.model_dump_json())
 
+    def is_debug_logging(self) -> bool:
+        """Whether debug (or more verbose) logging is enabled."""
+        return self.config.BITTENSOR.LOGGING_LEVEL in ("DEBUG", "TRACE")
+
     def setup_bittensor_objects(self):
         bt.logging.info("Setting up Bittensor objects.")
 
@@ -52,6 +62,7 @@ class BaseScoringApi(ABC):
         bt.logging.info(f"Dendrite: {self.dendrite}")
 
         self.metagraph = self.subtensor.metagraph(self.config.BITTENSOR.SUBNET_NETUID)
+        self._index_metagraph_hotkeys()
         bt.logging.info(f"Metagraph: {self.metagraph}")
 
         # if self.wallet.hotkey.ss58_address not in self.metagraph.hotkeys:
@@ -88,8 +99,9 @@ class BaseScoringApi(ABC):
                 bt.logging.success("Keyboard interrupt detected. Exiting validator.")
                 exit()
 
-            # Sleep until next weight update
-            time.sleep(self.config.EPOCH_LENGTH)
+            # Sleep until next weight update, waking early on shutdown
+            if self._shutdown.wait(timeout=self.config.EPOCH_LENGTH):
+                break
 
     def synthetic_loop_in_background_thread(self):
         """
@@ -99,6 +111,7 @@ class BaseScoringApi(ABC):
         if not self.is_running:
             bt.logging.debug("Starting validator in background thread.")
             self.should_exit = False
+            self._shutdown.clear()
             self.thread = threading.Thread(target=self.run, daemon=True)
             self.thread.start()
             self.is_running = True
@@ -106,6 +119,13 @@ class BaseScoringApi(ABC):
 
     def resync_metagraph(self):
         self.metagraph.sync(subtensor=self.subtensor)
+        self._index_metagraph_hotkeys()
+
+    def _index_metagraph_hotkeys(self):
+        """Build O(1) hotkey lookups from the current metagraph."""
+        hotkeys = list(self.metagraph.hotkeys)
+        self._hotkey_set: frozenset[str] = frozenset(hotkeys)
+        self._hotkey_by_uid: dict[int, str] = dict(enumerate(hotkeys))
 
     def _run_forward(self):
         """Run a single forward pass in a separate thread."""
@@ -127,17 +147,15 @@ class BaseScoringApi(ABC):
             bt.Config: Bittensor configuration object
         """
         bt_config = bt.Config()
-        # Set wallet configuration
-        if bt_config.wallet is None:
-            bt_config.wallet = bt.Config()
+        # Set wallet configuration, a fresh Config never has wallet/subtensor sections
+        bt_config.wallet = bt.Config()
         bt_config.wallet.path = os.getenv(
             "RT_BTCLI_WALLET_DIR", self.scoring_api_config.WALLET_DIR
         )
         bt_config.wallet.name = self.scoring_api_config.WALLET_NAME
         bt_config.wallet.hotkey = self.scoring_api_config.HOTKEY_NAME
 
-        if bt_config.subtensor is None:
-            bt_config.subtensor = bt.Config()
+        bt_config.subtensor = bt.Config()
         bt_config.subtensor.network = self.config.BITTENSOR.SUBTENSOR_NETWORK
 
         # Set netuid (subnet configuration)
@@ -165,6 +183,7 @@ class BaseScoringApi(ABC):
         if self.is_running:
             bt.logging.debug("Stopping validator in background thread.")
             self.should_exit = True
+            self._shutdown.set()
             # Clean up when exiting
             self.thread.join(5)
             if self.forward_thread and self.forward_thread.is_alive():
@@ -1,5 +1,16 @@
 import collections
-from typing import Any, Generic, Optional, TypeVar, Union, TYPE_CHECKING, Iterator, Set
+from typing import (
+    Any,
+    Generic,
+    Optional,
+    TypeVar,
+    Union,
+    TYPE_CHECKING,
+    Iterable,
+    Iterator,
+    KeysView,
+    Set,
+)
 
 from redteam_core.validator.models import ComparisonLog, ScoringLog
 
@@ -62,6 +73,24 @@ class LRUCache(Generic[KT, T]):
         # Add new item
         self.cache[key] = value
 
+    def set_many(self, items: Iterable[tuple[KT, T]]) -> None:
+        """
+        Add or update multiple items in the cache, evicting once at the end.
+
+        Args:
+            items: (key, value) pairs to set, in insertion order
+        """
+        try:
+            for key, value in items:
+                # If key exists, remove it first so it moves to the end
+                self.cache.pop(key, None)
+                self.cache[key] = value
+        finally:
+            # Remove oldest items until the cache fits
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+                self.evictions += 1
+
     def clear(self) -> None:
         """Clear the cache."""
         self.cache.clear()
@@ -85,7 +114,7 @@ class LRUCache(Generic[KT, T]):
         """Support dict-like assignment."""
         self.set(key, value)
 
-    def keys(self) -> Iterator[KT]:
+    def keys(self) -> KeysView[KT]:
         """Return all keys in the cache."""
         return self.cache.keys()
 
@@ -177,6 +206,24 @@ class ScoringLRUCache:
 
         self.caches[challenge].set(docker_hub_id, result)
 
+    def set_many(
+        self, challenge: str, items: Iterable[tuple[str, ScoringResultType]]
+    ) -> None:
+        """
+        Store multiple scoring results for a specific challenge in one batch.
+
+        Args:
+            challenge: Challenge name
+            items: (docker_hub_id, result) pairs to store
+        """
+        if challenge not in self.caches:
+            # Create a new cache if it doesn't exist
+            self.caches[challenge] = LRUCache[str, ScoringResultType](
+                maxsize=self.maxsize_per_challenge
+            )
+
+        self.caches[challenge].set_many(items)
+
     def get_all_for_challenge(self, challenge: str) -> dict[str, ScoringResultType]:
         """
         Get all cached results for a specific challenge.
@@ -192,6 +239,22 @@ class ScoringLRUCache:
 
         return dict(self.caches[challenge].items())
 
+    def keys_for_challenge(self, challenge: str) -> KeysView[str]:
+        """
+        Get a live view of the cached docker_hub_ids for a specific challenge.
+        Unlike get_all_for_challenge, this does not copy the cache.
+
+        Args:
+            challenge: Challenge name
+
+        Returns:
+            Keys view supporting O(1) membership checks
+        """
+        if challenge not in self.caches:
+            return {}.keys()
+
+        return self.caches[challenge].keys()
+
     def contains(self, challenge: str, docker_hub_id: str) -> bool:
         """
         Check if a specific docker_hub_id exists in the cache for a challenge.
@@ -5,6 +5,9 @@ from pydantic_settings import SettingsConfigDict
 
 from redteam_core.config import BaseConfig, ENV_PREFIX_SCORING_API
 
+# Cache directories already checked in this process
+_VALIDATED_CACHE_DIRS: set[str] = set()
+
 
 class ScoringApiMainConfig(BaseConfig):
     WALLET_DIR: str = Field(
@@ -33,9 +36,14 @@ class ScoringApiMainConfig(BaseConfig):
     def validate_cache_dir(self) -> Self:
         """Ensure cache directory exists and is writable."""
         expanded = os.path.expanduser(self.CACHE_DIR)
-        os.makedirs(expanded, exist_ok=True)
-        if not os.access(expanded, os.W_OK):
-            raise ValueError(f"Cache directory not writable: {expanded}")
+        if expanded not in _VALIDATED_CACHE_DIRS:
+            os.makedirs(expanded, exist_ok=True)
+            if not os.access(expanded, os.W_OK):
+                raise ValueError(f"Cache directory not writable: {expanded}")
+            _VALIDATED_CACHE_DIRS.add(expanded)
+        if self.CACHE_DIR != expanded:
+            # Bypass assignment validation to avoid re-running this validator
+            object.__setattr__(self, "CACHE_DIR", expanded)
         return self
 
 
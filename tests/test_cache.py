@@ -0,0 +1,66 @@
+import pytest
+
+from src.api.cache import LRUCache, ScoringLRUCache
+
+
+def test_set_many_inserts_in_order():
+    cache = LRUCache[str, int](maxsize=5)
+    cache.set_many([("a", 1), ("b", 2), ("c", 3)])
+
+    assert list(cache.keys()) == ["a", "b", "c"]
+    assert cache.evictions == 0
+
+
+def test_set_many_moves_existing_keys_to_end():
+    cache = LRUCache[str, int](maxsize=5)
+    cache.set_many([("a", 1), ("b", 2), ("c", 3)])
+    cache.set_many([("a", 10)])
+
+    assert list(cache.items()) == [("b", 2), ("c", 3), ("a", 10)]
+
+
+def test_set_many_evicts_oldest_when_batch_exceeds_maxsize():
+    cache = LRUCache[str, int](maxsize=3)
+    cache.set_many([("a", 1), ("b", 2)])
+    cache.set_many([("c", 3), ("d", 4), ("e", 5), ("f", 6)])
+
+    assert list(cache.items()) == [("d", 4), ("e", 5), ("f", 6)]
+    assert cache.evictions == 3
+
+
+def test_set_many_matches_set_contents():
+    items = [("a", 1), ("b", 2), ("a", 3), ("c", 4), ("d", 5), ("b", 6)]
+
+    batched = LRUCache[str, int](maxsize=3)
+    batched.set_many(items)
+
+    single = LRUCache[str, int](maxsize=3)
+    for key, value in items:
+        single.set(key, value)
+
+    assert list(batched.items()) == list(single.items())
+
+
+def test_set_many_keeps_partial_insert_when_generator_raises():
+    cache = LRUCache[str, int](maxsize=2)
+    cache.set("a", 0)
+
+    def _items():
+        yield "b", 1
+        yield "c", 2
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.set_many(_items())
+
+    assert list(cache.items()) == [("b", 1), ("c", 2)]
+    assert len(cache) == cache.maxsize
+    assert cache.evictions == 1
+
+
+def test_scoring_cache_set_many_creates_challenge_cache():
+    cache = ScoringLRUCache(challenges=[], maxsize_per_challenge=2)
+    cache.set_many("challenge", [("id-1", 1), ("id-2", 2), ("id-3", 3)])
+
+    assert list(cache.keys_for_challenge("challenge")) == ["id-2", "id-3"]
+    assert list(cache.keys_for_challenge("other")) == []
@@ -0,0 +1,81 @@
+from redteam_core.validator.models import MinerChallengeCommit
+
+from src.api.__main__ import _merge_miner_commit
+
+
+def _make_commit(
+    encrypted_commit: str,
+    commit_timestamp: float | None,
+    key: str | None = None,
+    commit: str | None = None,
+) -> MinerChallengeCommit:
+    return MinerChallengeCommit.model_construct(
+        miner_uid=1,
+        miner_hotkey="hotkey",
+        challenge_name="challenge",
+        encrypted_commit=encrypted_commit,
+        commit_timestamp=commit_timestamp,
+        key=key,
+        commit=commit,
+    )
+
+
+def test_same_commit_keeps_current_with_older_timestamp():
+    current = _make_commit("enc", 200.0)
+    candidate = _make_commit("enc", 100.0)
+
+    merged = _merge_miner_commit(current, candidate)
+
+    assert merged is current
+    assert merged.commit_timestamp == 100.0
+
+
+def test_same_commit_ignores_newer_timestamp():
+    current = _make_commit("enc", 100.0)
+    candidate = _make_commit("enc", 200.0)
+
+    merged = _merge_miner_commit(current, candidate)
+
+    assert merged is current
+    assert merged.commit_timestamp == 100.0
+
+
+def test_same_commit_backfills_missing_key_and_commit():
+    current = _make_commit("enc", 100.0)
+    candidate = _make_commit("enc", 100.0, key="key", commit="repo@sha256:abc")
+
+    merged = _merge_miner_commit(current, candidate)
+
+    assert merged is current
+    assert merged.key == "key"
+    assert merged.commit == "repo@sha256:abc"
+
+
+def test_same_commit_keeps_existing_key_and_commit():
+    current = _make_commit("enc", 100.0, key="key", commit="repo@sha256:abc")
+    candidate = _make_commit("enc", 100.0, key="other", commit="repo@sha256:def")
+
+    merged = _merge_miner_commit(current, candidate)
+
+    assert merged.key == "key"
+    assert merged.commit == "repo@sha256:abc"
+
+
+def test_different_commit_keeps_newer():
+    current = _make_commit("enc-old", 100.0)
+    candidate = _make_commit("enc-new", 200.0)
+
+    assert _merge_miner_commit(current, candidate) is candidate
+    assert _merge_miner_commit(candidate, current) is candidate
+
+
+def test_different_commit_without_timestamp_keeps_current():
+    current = _make_commit("enc-old", None)
+    candidate = _make_commit("enc-new", 200.0)
+
+    assert _merge_miner_commit(current, candidate) is current
+
+    current = _make_commit("enc-old", 100.0)
+    candidate = _make_commit("enc-new", None)
+
+    assert _merge_miner_commit(current, candidate) is current